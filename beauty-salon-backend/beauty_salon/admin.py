@@ -163,6 +163,7 @@ class ClientProfileAdmin(admin.ModelAdmin):
 @admin.register(EmployeeSchedule)
 class EmployeeScheduleAdmin(admin.ModelAdmin):
     list_display = ("employee", "created_at", "updated_at")
+    list_select_related = ("employee",)
     search_fields = (
         "employee__employee_number",
         "employee__first_name",
@@ -174,6 +175,7 @@ class EmployeeScheduleAdmin(admin.ModelAdmin):
 @admin.register(TimeOff)
 class TimeOffAdmin(admin.ModelAdmin):
     list_display = ("employee", "date_from", "date_to", "reason", "created_at")
+    list_select_related = ("employee",)
     list_filter = ("date_from", "date_to", "created_at")
     search_fields = (
         "employee__employee_number",
@@ -202,6 +204,7 @@ class AppointmentAdmin(admin.ModelAdmin):
         "status",
         "created_at",
     )
+    list_select_related = ("client", "employee", "service")
     list_filter = ("status", "start", "created_at")
     search_fields = (
         "client__client_number",
@@ -251,6 +254,7 @@ class SystemSettingsAdmin(admin.ModelAdmin):
 @admin.register(SystemLog)
 class SystemLogAdmin(admin.ModelAdmin):
     list_display = ("action", "performed_by", "target_user", "timestamp")
+    list_select_related = ("performed_by", "target_user")
     list_filter = ("action", "timestamp")
     search_fields = ("action", "performed_by__username", "target_user__username")
     readonly_fields = ("action", "performed_by", "target_user", "timestamp")
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import timedelta
 from decimal import Decimal
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
 from django.utils import timezone
 
 from beauty_salon.models import (
@@ -18,22 +23,193 @@ from beauty_salon.models import (
     TimeOff,
 )
 
+logger = logging.getLogger(__name__)
+
+BULK_BATCH_SIZE = int(os.getenv("SEED_BULK_BATCH_SIZE", "500"))
+
+OPENING_HOURS = {
+    "mon": [{"start": "09:00", "end": "18:00"}],
+    "tue": [{"start": "09:00", "end": "18:00"}],
+    "wed": [{"start": "09:00", "end": "18:00"}],
+    "thu": [{"start": "09:00", "end": "18:00"}],
+    "fri": [{"start": "09:00", "end": "18:00"}],
+    "sat": [{"start": "10:00", "end": "16:00"}],
+    "sun": [],
+}
+
+EMPLOYEES = [
+    {
+        "username": "anna.kowalska",
+        "first_name": "Anna",
+        "last_name": "Kowalska",
+        "email": "anna.kowalska@beautysalon.pl",
+        "phone": "+48501234567",
+        "employee_number": "00000001",
+    },
+    {
+        "username": "maria.nowak",
+        "first_name": "Maria",
+        "last_name": "Nowak",
+        "email": "maria.nowak@beautysalon.pl",
+        "phone": "+48502345678",
+        "employee_number": "00000002",
+    },
+    {
+        "username": "zofia.wisniewska",
+        "first_name": "Zofia",
+        "last_name": "Wiśniewska",
+        "email": "zofia.wisniewska@beautysalon.pl",
+        "phone": "+48503456789",
+        "employee_number": "00000003",
+    },
+]
+
+
+@dataclass(frozen=True, slots=True)
+class ServiceDef:
+    name: str
+    category: str
+    price: Decimal
+    duration_minutes: int
+
+
+SERVICES: tuple[ServiceDef, ...] = (
+    ServiceDef("Manicure klasyczny", "Paznokcie", Decimal("50.00"), 45),
+    ServiceDef("Manicure hybrydowy", "Paznokcie", Decimal("80.00"), 60),
+    ServiceDef("Manicure żelowy", "Paznokcie", Decimal("100.00"), 90),
+    ServiceDef("Pedicure klasyczny", "Paznokcie", Decimal("60.00"), 60),
+    ServiceDef("Pedicure hybrydowy", "Paznokcie", Decimal("90.00"), 75),
+    ServiceDef("Przedłużanie rzęs 1:1", "Rzęsy", Decimal("120.00"), 90),
+    ServiceDef("Przedłużanie rzęs 2D-3D", "Rzęsy", Decimal("150.00"), 120),
+    ServiceDef("Lifting rzęs", "Rzęsy", Decimal("100.00"), 60),
+    ServiceDef("Uzupełnienie rzęs", "Rzęsy", Decimal("80.00"), 60),
+    ServiceDef("Stylizacja brwi", "Brwi", Decimal("40.00"), 30),
+    ServiceDef("Henna brwi", "Brwi", Decimal("50.00"), 45),
+    ServiceDef("Microblading", "Brwi", Decimal("400.00"), 120),
+    ServiceDef("Oczyszczanie wodorowe", "Twarz", Decimal("120.00"), 60),
+    ServiceDef("Mezoterapia igłowa", "Twarz", Decimal("200.00"), 45),
+    ServiceDef("Peeling kawitacyjny", "Twarz", Decimal("100.00"), 45),
+    ServiceDef("Masaż twarzy", "Twarz", Decimal("80.00"), 45),
+    ServiceDef("Depilacja woskiem - nogi", "Depilacja", Decimal("80.00"), 45),
+    ServiceDef("Depilacja woskiem - pachy", "Depilacja", Decimal("40.00"), 20),
+    ServiceDef("Depilacja laserowa - nogi", "Depilacja", Decimal("300.00"), 60),
+    ServiceDef("Masaż relaksacyjny", "Masaż", Decimal("150.00"), 60),
+)
 
-def _dt(days_offset: int, hour: int, minute: int = 0):
-    now = timezone.localtime(timezone.now())
+CLIENTS = [
+    {
+        "num": "00000001",
+        "first_name": "Katarzyna",
+        "last_name": "Zielińska",
+        "email": "katarzyna.zielinska@gmail.com",
+        "phone": "+48601234567",
+    },
+    {
+        "num": "00000002",
+        "first_name": "Magdalena",
+        "last_name": "Lewandowska",
+        "email": "magdalena.lewandowska@gmail.com",
+        "phone": "+48602345678",
+    },
+    {
+        "num": "00000003",
+        "first_name": "Agnieszka",
+        "last_name": "Kamińska",
+        "email": "agnieszka.kaminska@gmail.com",
+        "phone": "+48603456789",
+    },
+    {
+        "num": "00000004",
+        "first_name": "Julia",
+        "last_name": "Kowalczyk",
+        "email": "julia.kowalczyk@gmail.com",
+        "phone": "+48604567890",
+    },
+    {
+        "num": "00000005",
+        "first_name": "Natalia",
+        "last_name": "Wójcik",
+        "email": "natalia.wojcik@gmail.com",
+        "phone": "+48605678901",
+    },
+]
+
+WEEKLY_HOURS = {
+    "mon": [{"start": "09:00", "end": "17:00"}],
+    "tue": [{"start": "09:00", "end": "17:00"}],
+    "wed": [{"start": "09:00", "end": "17:00"}],
+    "thu": [{"start": "09:00", "end": "17:00"}],
+    "fri": [{"start": "09:00", "end": "17:00"}],
+    "sat": [{"start": "10:00", "end": "15:00"}],
+    "sun": [],
+}
+
+SKILL_CATEGORIES = (
+    ("Paznokcie", "Rzęsy", "Brwi"),
+    ("Twarz", "Depilacja"),
+    ("Rzęsy", "Masaż"),
+)
+
+# (client, employee, service) indexes into the seeded rows, then day offset,
+# hour, minute and status.
+APPOINTMENTS = (
+    (0, 0, 1, -7, 10, 0, Appointment.Status.COMPLETED),
+    (1, 1, 13, -5, 14, 0, Appointment.Status.COMPLETED),
+    (2, 2, 5, -3, 11, 0, Appointment.Status.COMPLETED),
+    (0, 0, 3, -10, 15, 0, Appointment.Status.COMPLETED),
+    (3, 0, 0, -2, 16, 0, Appointment.Status.CANCELLED),
+    (4, 1, 12, -1, 14, 0, Appointment.Status.NO_SHOW),
+    (0, 0, 2, 2, 10, 0, Appointment.Status.CONFIRMED),
+    (1, 1, 14, 3, 15, 0, Appointment.Status.CONFIRMED),
+    (2, 2, 7, 4, 12, 0, Appointment.Status.CONFIRMED),
+    (3, 0, 4, 5, 14, 0, Appointment.Status.PENDING),
+    (4, 1, 16, 7, 11, 0, Appointment.Status.PENDING),
+)
+
+
+def _dt(now, days_offset: int, hour: int, minute: int = 0):
     d = now + timedelta(days=days_offset)
     return d.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
 
+# Order matters for the ORM fallback: children before the rows they reference.
+CLEARED_MODELS = (
+    Appointment,
+    TimeOff,
+    EmployeeSchedule,
+    ClientProfile,
+    EmployeeProfile.skills.through,
+    EmployeeProfile,
+    Service,
+)
+
+
+def _clear_seeded_tables() -> None:
+    if connection.vendor == "postgresql":
+        # One statement, no per-row work. The list covers every table that
+        # references these ones, so no CASCADE is needed; PostgreSQL refuses
+        # the TRUNCATE if a new referencing table is ever left out.
+        tables = ", ".join(
+            connection.ops.quote_name(model._meta.db_table) for model in CLEARED_MODELS
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {tables} RESTART IDENTITY")
+        return
+
+    for model in CLEARED_MODELS:
+        model.objects.all().delete()
+
+
 @transaction.atomic
 def seed(clear: bool = False, demo: bool = False, password: str = "demo123") -> None:
+    if connection.vendor == "postgresql":
+        # Demo data only: let this one transaction commit without waiting for
+        # the WAL flush. SET LOCAL reverts automatically at COMMIT/ROLLBACK.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit TO OFF")
+
     if clear:
-        Appointment.objects.all().delete()
-        TimeOff.objects.all().delete()
-        EmployeeSchedule.objects.all().delete()
-        ClientProfile.objects.all().delete()
-        EmployeeProfile.objects.all().delete()
-        Service.objects.all().delete()
+        _clear_seeded_tables()
         CustomUser.objects.filter(is_superuser=False).delete()
 
     settings_obj, _ = SystemSettings.objects.get_or_create(
@@ -42,19 +218,15 @@ def seed(clear: bool = False, demo: bool = False, password: str = "demo123") ->
             "salon_name": "Beauty Salon",
             "slot_minutes": 15,
             "buffer_minutes": 10,
-            "opening_hours": {
-                "mon": [{"start": "09:00", "end": "18:00"}],
-                "tue": [{"start": "09:00", "end": "18:00"}],
-                "wed": [{"start": "09:00", "end": "18:00"}],
-                "thu": [{"start": "09:00", "end": "18:00"}],
-                "fri": [{"start": "09:00", "end": "18:00"}],
-                "sat": [{"start": "10:00", "end": "16:00"}],
-                "sun": [],
-            },
+            "opening_hours": OPENING_HOURS,
         },
     )
     buffer_minutes = int(settings_obj.buffer_minutes or 10)
 
+    # Every seeded account shares one password, so it is hashed once per run
+    # and assigned directly instead of calling set_password() per user.
+    hashed_password = make_password(password)
+
     admin, created = CustomUser.objects.get_or_create(
         username="admin-00000001",
         defaults={
@@ -65,483 +237,357 @@ def seed(clear: bool = False, demo: bool = False, password: str = "demo123") ->
             "is_staff": True,
             "is_superuser": True,
             "is_active": True,
+            "password": hashed_password,
         },
     )
-    if created:
-        admin.set_password(password)
+    if not created and (
+        not admin.is_staff
+        or not admin.is_superuser
+        or admin.role != CustomUser.Role.ADMIN
+    ):
+        admin.is_staff = True
+        admin.is_superuser = True
+        admin.role = CustomUser.Role.ADMIN
         admin.full_clean()
-        admin.save()
-    else:
-        if (
-            not admin.is_staff
-            or not admin.is_superuser
-            or admin.role != CustomUser.Role.ADMIN
-        ):
-            admin.is_staff = True
-            admin.is_superuser = True
-            admin.role = CustomUser.Role.ADMIN
-            admin.full_clean()
-            admin.save()
-
-    employees_data = [
-        {
-            "username": "anna.kowalska",
-            "first_name": "Anna",
-            "last_name": "Kowalska",
-            "email": "anna.kowalska@beautysalon.pl",
-            "phone": "+48501234567",
-            "employee_number": "00000001",
-        },
-        {
-            "username": "maria.nowak",
-            "first_name": "Maria",
-            "last_name": "Nowak",
-            "email": "maria.nowak@beautysalon.pl",
-            "phone": "+48502345678",
-            "employee_number": "00000002",
-        },
-        {
-            "username": "zofia.wisniewska",
-            "first_name": "Zofia",
-            "last_name": "Wiśniewska",
-            "email": "zofia.wisniewska@beautysalon.pl",
-            "phone": "+48503456789",
-            "employee_number": "00000003",
-        },
-    ]
+        admin.save(update_fields=["is_staff", "is_superuser", "role"])
 
-    employee_profiles = []
-    for e in employees_data:
-        u, created = CustomUser.objects.get_or_create(
-            username=e["username"],
-            defaults={
-                "first_name": e["first_name"],
-                "last_name": e["last_name"],
-                "email": e["email"],
-                "role": CustomUser.Role.EMPLOYEE,
-                "is_active": True,
-                "is_staff": True,
-            },
+    employee_users = (
+        {}
+        if clear
+        else CustomUser.objects.in_bulk(
+            [e["username"] for e in EMPLOYEES], field_name="username"
         )
-        if created:
-            u.set_password(password)
+    )
+    new_employee_users = []
+    updated_employee_users = []
+    for e in EMPLOYEES:
+        u = employee_users.get(e["username"])
+        if u is None:
+            u = CustomUser(
+                username=e["username"],
+                first_name=e["first_name"],
+                last_name=e["last_name"],
+                email=e["email"],
+                role=CustomUser.Role.EMPLOYEE,
+                is_active=True,
+                is_staff=True,
+                password=hashed_password,
+            )
+            u.full_clean(validate_unique=False)
+            new_employee_users.append(u)
+            employee_users[e["username"]] = u
         else:
             u.role = CustomUser.Role.EMPLOYEE
             u.is_active = True
             u.is_staff = True
+            u.full_clean(validate_unique=False)
+            updated_employee_users.append(u)
+
+    CustomUser.objects.bulk_create(new_employee_users, batch_size=BULK_BATCH_SIZE)
+    CustomUser.objects.bulk_update(
+        updated_employee_users,
+        ["role", "is_active", "is_staff"],
+        batch_size=BULK_BATCH_SIZE,
+    )
 
-        u.full_clean()
-        u.save()
-
-        profile, _ = EmployeeProfile.objects.get_or_create(
-            user=u,
-            defaults={
-                "employee_number": e["employee_number"],
-                "first_name": e["first_name"],
-                "last_name": e["last_name"],
-                "phone": e["phone"],
-                "is_active": True,
-            },
-        )
+    existing_employee_profiles = (
+        {}
+        if clear
+        else {
+            p.user_id: p
+            for p in EmployeeProfile.objects.filter(
+                user__in=[employee_users[e["username"]] for e in EMPLOYEES]
+            )
+        }
+    )
 
-        if not profile.employee_number:
+    employee_profiles = []
+    new_employee_profiles = []
+    renumbered_employee_profiles = []
+    for e in EMPLOYEES:
+        u = employee_users[e["username"]]
+        profile = existing_employee_profiles.get(u.pk)
+        if profile is None:
+            profile = EmployeeProfile(
+                user=u,
+                employee_number=e["employee_number"],
+                first_name=e["first_name"],
+                last_name=e["last_name"],
+                phone=e["phone"],
+                is_active=True,
+            )
+            new_employee_profiles.append(profile)
+        elif not profile.employee_number:
             profile.employee_number = e["employee_number"]
-            profile.save(update_fields=["employee_number"])
+            renumbered_employee_profiles.append(profile)
 
         employee_profiles.append(profile)
 
-    services_data = [
-        {
-            "name": "Manicure klasyczny",
-            "category": "Paznokcie",
-            "price": 50,
-            "duration": 45,
-        },
-        {
-            "name": "Manicure hybrydowy",
-            "category": "Paznokcie",
-            "price": 80,
-            "duration": 60,
-        },
-        {
-            "name": "Manicure żelowy",
-            "category": "Paznokcie",
-            "price": 100,
-            "duration": 90,
-        },
-        {
-            "name": "Pedicure klasyczny",
-            "category": "Paznokcie",
-            "price": 60,
-            "duration": 60,
-        },
-        {
-            "name": "Pedicure hybrydowy",
-            "category": "Paznokcie",
-            "price": 90,
-            "duration": 75,
-        },
-        {
-            "name": "Przedłużanie rzęs 1:1",
-            "category": "Rzęsy",
-            "price": 120,
-            "duration": 90,
-        },
-        {
-            "name": "Przedłużanie rzęs 2D-3D",
-            "category": "Rzęsy",
-            "price": 150,
-            "duration": 120,
-        },
-        {"name": "Lifting rzęs", "category": "Rzęsy", "price": 100, "duration": 60},
-        {"name": "Uzupełnienie rzęs", "category": "Rzęsy", "price": 80, "duration": 60},
-        {"name": "Stylizacja brwi", "category": "Brwi", "price": 40, "duration": 30},
-        {"name": "Henna brwi", "category": "Brwi", "price": 50, "duration": 45},
-        {"name": "Microblading", "category": "Brwi", "price": 400, "duration": 120},
-        {
-            "name": "Oczyszczanie wodorowe",
-            "category": "Twarz",
-            "price": 120,
-            "duration": 60,
-        },
-        {
-            "name": "Mezoterapia igłowa",
-            "category": "Twarz",
-            "price": 200,
-            "duration": 45,
-        },
-        {
-            "name": "Peeling kawitacyjny",
-            "category": "Twarz",
-            "price": 100,
-            "duration": 45,
-        },
-        {"name": "Masaż twarzy", "category": "Twarz", "price": 80, "duration": 45},
-        {
-            "name": "Depilacja woskiem - nogi",
-            "category": "Depilacja",
-            "price": 80,
-            "duration": 45,
-        },
-        {
-            "name": "Depilacja woskiem - pachy",
-            "category": "Depilacja",
-            "price": 40,
-            "duration": 20,
-        },
-        {
-            "name": "Depilacja laserowa - nogi",
-            "category": "Depilacja",
-            "price": 300,
-            "duration": 60,
-        },
-        {
-            "name": "Masaż relaksacyjny",
-            "category": "Masaż",
-            "price": 150,
-            "duration": 60,
-        },
-    ]
+    EmployeeProfile.objects.bulk_create(new_employee_profiles, batch_size=BULK_BATCH_SIZE)
+    EmployeeProfile.objects.bulk_update(
+        renumbered_employee_profiles, ["employee_number"], batch_size=BULK_BATCH_SIZE
+    )
 
+    existing_services = (
+        {}
+        if clear
+        else Service.objects.in_bulk([s.name for s in SERVICES], field_name="name")
+    )
     services = []
-    for s in services_data:
-        obj, _ = Service.objects.get_or_create(
-            name=s["name"],
-            defaults={
-                "category": s["category"],
-                "description": f"Profesjonalna {s['name'].lower()}",
-                "price": Decimal(str(s["price"])),
-                "duration_minutes": s["duration"],
-                "is_active": True,
-            },
-        )
+    new_services = []
+    for s in SERVICES:
+        obj = existing_services.get(s.name)
+        if obj is None:
+            obj = Service(
+                name=s.name,
+                category=s.category,
+                description=f"Profesjonalna {s.name.lower()}",
+                price=s.price,
+                duration_minutes=s.duration_minutes,
+                is_active=True,
+            )
+            new_services.append(obj)
         services.append(obj)
 
-    if employee_profiles:
-        employee_profiles[0].skills.set(services[0:12])
-    if len(employee_profiles) > 1:
-        employee_profiles[1].skills.set(services[12:19])
-    if len(employee_profiles) > 2:
-        employee_profiles[2].skills.set(
-            [services[5], services[6], services[7], services[8], services[19]]
-        )
+    Service.objects.bulk_create(new_services, batch_size=BULK_BATCH_SIZE)
+
+    services_by_category = defaultdict(list)
+    for svc in services:
+        services_by_category[svc.category].append(svc)
+
+    EmployeeSkill = EmployeeProfile.skills.through
+    if not clear:
+        EmployeeSkill.objects.filter(employeeprofile__in=employee_profiles).delete()
+    EmployeeSkill.objects.bulk_create(
+        [
+            EmployeeSkill(employeeprofile_id=emp.pk, service_id=svc.pk)
+            for emp, categories in zip(employee_profiles, SKILL_CATEGORIES)
+            for category in categories
+            for svc in services_by_category[category]
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
 
-    schedule = {
-        "mon": [{"start": "09:00", "end": "17:00"}],
-        "tue": [{"start": "09:00", "end": "17:00"}],
-        "wed": [{"start": "09:00", "end": "17:00"}],
-        "thu": [{"start": "09:00", "end": "17:00"}],
-        "fri": [{"start": "09:00", "end": "17:00"}],
-        "sat": [{"start": "10:00", "end": "15:00"}],
-        "sun": [],
-    }
-    for emp in employee_profiles:
-        EmployeeSchedule.objects.get_or_create(
-            employee=emp, defaults={"weekly_hours": schedule}
+    scheduled_employee_ids = (
+        set()
+        if clear
+        else set(
+            EmployeeSchedule.objects.filter(employee__in=employee_profiles).values_list(
+                "employee_id", flat=True
+            )
         )
+    )
+    EmployeeSchedule.objects.bulk_create(
+        [
+            EmployeeSchedule(employee_id=emp.pk, weekly_hours=WEEKLY_HOURS)
+            for emp in employee_profiles
+            if emp.pk not in scheduled_employee_ids
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
 
-    clients_data = [
-        {
-            "num": "00000001",
-            "first_name": "Katarzyna",
-            "last_name": "Zielińska",
-            "email": "katarzyna.zielinska@gmail.com",
-            "phone": "+48601234567",
-        },
-        {
-            "num": "00000002",
-            "first_name": "Magdalena",
-            "last_name": "Lewandowska",
-            "email": "magdalena.lewandowska@gmail.com",
-            "phone": "+48602345678",
-        },
-        {
-            "num": "00000003",
-            "first_name": "Agnieszka",
-            "last_name": "Kamińska",
-            "email": "agnieszka.kaminska@gmail.com",
-            "phone": "+48603456789",
-        },
-        {
-            "num": "00000004",
-            "first_name": "Julia",
-            "last_name": "Kowalczyk",
-            "email": "julia.kowalczyk@gmail.com",
-            "phone": "+48604567890",
-        },
-        {
-            "num": "00000005",
-            "first_name": "Natalia",
-            "last_name": "Wójcik",
-            "email": "natalia.wojcik@gmail.com",
-            "phone": "+48605678901",
-        },
-    ]
-
-    client_profiles = []
-    for c in clients_data:
-        username = f"klient-{c['num']}"
-        u, created = CustomUser.objects.get_or_create(
-            username=username,
-            defaults={
-                "first_name": c["first_name"],
-                "last_name": c["last_name"],
-                "email": c["email"],
-                "role": CustomUser.Role.CLIENT,
-                "is_active": True,
-            },
+    client_users = (
+        {}
+        if clear
+        else CustomUser.objects.in_bulk(
+            [f"klient-{c['num']}" for c in CLIENTS], field_name="username"
         )
-        if created:
-            u.set_password(password)
+    )
+    new_client_users = []
+    updated_client_users = []
+    for c in CLIENTS:
+        username = f"klient-{c['num']}"
+        u = client_users.get(username)
+        if u is None:
+            u = CustomUser(
+                username=username,
+                first_name=c["first_name"],
+                last_name=c["last_name"],
+                email=c["email"],
+                role=CustomUser.Role.CLIENT,
+                is_active=True,
+                password=hashed_password,
+            )
+            u.full_clean(validate_unique=False)
+            new_client_users.append(u)
+            client_users[username] = u
         else:
             u.role = CustomUser.Role.CLIENT
             u.is_active = True
             u.first_name = c["first_name"]
             u.last_name = c["last_name"]
             u.email = c["email"]
+            u.full_clean(validate_unique=False)
+            updated_client_users.append(u)
+
+    CustomUser.objects.bulk_create(new_client_users, batch_size=BULK_BATCH_SIZE)
+    CustomUser.objects.bulk_update(
+        updated_client_users,
+        ["role", "is_active", "first_name", "last_name", "email"],
+        batch_size=BULK_BATCH_SIZE,
+    )
 
-        u.full_clean()
-        u.save()
-
-        profile, _ = ClientProfile.objects.get_or_create(
-            user=u,
-            defaults={
-                "client_number": c["num"],
-                "first_name": c["first_name"],
-                "last_name": c["last_name"],
-                "email": c["email"],
-                "phone": c["phone"],
-                "is_active": True,
-            },
-        )
+    existing_client_profiles = (
+        {}
+        if clear
+        else {
+            p.user_id: p
+            for p in ClientProfile.objects.filter(user__in=list(client_users.values()))
+        }
+    )
 
-        if not profile.client_number:
+    client_profiles = []
+    new_client_profiles = []
+    renumbered_client_profiles = []
+    for c in CLIENTS:
+        u = client_users[f"klient-{c['num']}"]
+        profile = existing_client_profiles.get(u.pk)
+        if profile is None:
+            profile = ClientProfile(
+                user=u,
+                client_number=c["num"],
+                first_name=c["first_name"],
+                last_name=c["last_name"],
+                email=c["email"],
+                phone=c["phone"],
+                is_active=True,
+            )
+            new_client_profiles.append(profile)
+        elif not profile.client_number:
             profile.client_number = c["num"]
-            profile.save(update_fields=["client_number"])
+            renumbered_client_profiles.append(profile)
 
         client_profiles.append(profile)
 
-    def calc_end(start_dt, service_obj):
-        return start_dt + timedelta(
-            minutes=int(service_obj.duration_minutes) + buffer_minutes
-        )
+    ClientProfile.objects.bulk_create(new_client_profiles, batch_size=BULK_BATCH_SIZE)
+    ClientProfile.objects.bulk_update(
+        renumbered_client_profiles, ["client_number"], batch_size=BULK_BATCH_SIZE
+    )
+
+    now = timezone.localtime(timezone.now())
+    today = now.date()
+
+    slot_lengths = {
+        svc.id: timedelta(minutes=int(svc.duration_minutes) + buffer_minutes)
+        for svc in services
+    }
 
     if client_profiles and employee_profiles and services:
-        appointments = [
-            (
-                client_profiles[0],
-                employee_profiles[0],
-                services[1],
-                -7,
-                10,
-                0,
-                Appointment.Status.COMPLETED,
-            ),
-            (
-                client_profiles[1],
-                employee_profiles[1],
-                services[13],
-                -5,
-                14,
-                0,
-                Appointment.Status.COMPLETED,
-            ),
-            (
-                client_profiles[2],
-                employee_profiles[2],
-                services[5],
-                -3,
-                11,
-                0,
-                Appointment.Status.COMPLETED,
-            ),
-            (
-                client_profiles[0],
-                employee_profiles[0],
-                services[3],
-                -10,
-                15,
-                0,
-                Appointment.Status.COMPLETED,
-            ),
-            (
-                client_profiles[3],
-                employee_profiles[0],
-                services[0],
-                -2,
-                16,
-                0,
-                Appointment.Status.CANCELLED,
-            ),
-            (
-                client_profiles[4],
-                employee_profiles[1],
-                services[12],
-                -1,
-                14,
-                0,
-                Appointment.Status.NO_SHOW,
-            ),
-            (
-                client_profiles[0],
-                employee_profiles[0],
-                services[2],
-                2,
-                10,
-                0,
-                Appointment.Status.CONFIRMED,
-            ),
-            (
-                client_profiles[1],
-                employee_profiles[1],
-                services[14],
-                3,
-                15,
-                0,
-                Appointment.Status.CONFIRMED,
-            ),
-            (
-                client_profiles[2],
-                employee_profiles[2],
-                services[7],
-                4,
-                12,
-                0,
-                Appointment.Status.CONFIRMED,
-            ),
-            (
-                client_profiles[3],
-                employee_profiles[0],
-                services[4],
-                5,
-                14,
-                0,
-                Appointment.Status.PENDING,
-            ),
-            (
-                client_profiles[4],
-                employee_profiles[1],
-                services[16],
-                7,
-                11,
-                0,
-                Appointment.Status.PENDING,
-            ),
-        ]
-
-        for client, emp, svc, days, hour, minute, appt_status in appointments:
-            start = _dt(days, hour, minute)
-            Appointment.objects.get_or_create(
-                client=client,
-                employee=emp,
-                service=svc,
-                start=start,
-                defaults={
-                    "end": calc_end(start, svc),
-                    "status": appt_status,
-                },
+        new_appointments = []
+        for client_idx, emp_idx, svc_idx, days, hour, minute, appt_status in APPOINTMENTS:
+            svc = services[svc_idx]
+            start = _dt(now, days, hour, minute)
+            new_appointments.append(
+                Appointment(
+                    client_id=client_profiles[client_idx].pk,
+                    employee_id=employee_profiles[emp_idx].pk,
+                    service_id=svc.pk,
+                    service_price=svc.price,
+                    start=start,
+                    end=start + slot_lengths[svc.pk],
+                    status=appt_status,
+                )
             )
 
-    today = timezone.localdate()
+        existing_appointments = (
+            set()
+            if clear
+            else set(
+                Appointment.objects.filter(
+                    employee__in=employee_profiles,
+                    start__in=[a.start for a in new_appointments],
+                ).values_list("client_id", "employee_id", "service_id", "start")
+            )
+        )
+        Appointment.objects.bulk_create(
+            [
+                a
+                for a in new_appointments
+                if (a.client_id, a.employee_id, a.service_id, a.start)
+                not in existing_appointments
+            ],
+            batch_size=BULK_BATCH_SIZE,
+        )
 
+    timeoffs = []
     if employee_profiles:
-        TimeOff.objects.get_or_create(
-            employee=employee_profiles[0],
-            date_from=today + timedelta(days=20),
-            date_to=today + timedelta(days=25),
-            defaults={
-                "reason": "Urlop wypoczynkowy",
-                "status": TimeOff.Status.PENDING,
-                "requested_by": employee_profiles[0].user,
-            },
+        timeoffs.append(
+            TimeOff(
+                employee_id=employee_profiles[0].pk,
+                date_from=today + timedelta(days=20),
+                date_to=today + timedelta(days=25),
+                reason="Urlop wypoczynkowy",
+                status=TimeOff.Status.PENDING,
+                requested_by_id=employee_profiles[0].user_id,
+            )
         )
 
     if len(employee_profiles) > 1:
-        TimeOff.objects.get_or_create(
-            employee=employee_profiles[1],
-            date_from=today + timedelta(days=30),
-            date_to=today + timedelta(days=35),
-            defaults={
-                "reason": "Wakacje",
-                "status": TimeOff.Status.APPROVED,
-                "requested_by": employee_profiles[1].user,
-                "decided_by": admin,
-                "decided_at": timezone.now(),
-            },
+        timeoffs.append(
+            TimeOff(
+                employee_id=employee_profiles[1].pk,
+                date_from=today + timedelta(days=30),
+                date_to=today + timedelta(days=35),
+                reason="Wakacje",
+                status=TimeOff.Status.APPROVED,
+                requested_by_id=employee_profiles[1].user_id,
+                decided_by_id=admin.pk,
+                decided_at=now,
+            )
         )
 
     if len(employee_profiles) > 2:
-        TimeOff.objects.get_or_create(
-            employee=employee_profiles[2],
-            date_from=today + timedelta(days=10),
-            date_to=today + timedelta(days=12),
-            defaults={
-                "reason": "Sprawy rodzinne",
-                "status": TimeOff.Status.REJECTED,
-                "requested_by": employee_profiles[2].user,
-                "decided_by": admin,
-                "decided_at": timezone.now() - timedelta(days=1),
-            },
+        timeoffs.append(
+            TimeOff(
+                employee_id=employee_profiles[2].pk,
+                date_from=today + timedelta(days=10),
+                date_to=today + timedelta(days=12),
+                reason="Sprawy rodzinne",
+                status=TimeOff.Status.REJECTED,
+                requested_by_id=employee_profiles[2].user_id,
+                decided_by_id=admin.pk,
+                decided_at=now - timedelta(days=1),
+            )
         )
 
     if employee_profiles:
-        TimeOff.objects.get_or_create(
-            employee=employee_profiles[0],
-            date_from=today + timedelta(days=5),
-            date_to=today + timedelta(days=7),
-            defaults={
-                "reason": "Pilne sprawy",
-                "status": TimeOff.Status.CANCELLED,
-                "requested_by": employee_profiles[0].user,
-                "decided_by": employee_profiles[0].user,
-                "decided_at": timezone.now() - timedelta(hours=2),
-            },
+        timeoffs.append(
+            TimeOff(
+                employee_id=employee_profiles[0].pk,
+                date_from=today + timedelta(days=5),
+                date_to=today + timedelta(days=7),
+                reason="Pilne sprawy",
+                status=TimeOff.Status.CANCELLED,
+                requested_by_id=employee_profiles[0].user_id,
+                decided_by_id=employee_profiles[0].user_id,
+                decided_at=now - timedelta(hours=2),
+            )
+        )
+
+    existing_timeoffs = (
+        set()
+        if clear
+        else set(
+            TimeOff.objects.filter(employee__in=employee_profiles).values_list(
+                "employee_id", "date_from", "date_to"
+            )
         )
+    )
+    TimeOff.objects.bulk_create(
+        [
+            t
+            for t in timeoffs
+            if (t.employee_id, t.date_from, t.date_to) not in existing_timeoffs
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
 
-    print("Seed completed successfully.")
-    print(f"Admin: admin-00000001 / {password}")
-    print(f"Employee: anna.kowalska / {password}")
-    print(f"Client: klient-00000001 / {password}")
+    logger.info(
+        "Seed completed: %d employees, %d clients, %d services.",
+        len(employee_profiles),
+        len(client_profiles),
+        len(services),
+    )
 
 
 class Command(BaseCommand):
@@ -559,5 +605,20 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        seed(clear=options["clear"], demo=options["demo"], password=options["password"])
-        self.stdout.write(self.style.SUCCESS("Data seeding completed."))
+        password = options["password"]
+        seed(clear=options["clear"], demo=options["demo"], password=password)
+
+        if options["verbosity"] < 1:
+            return
+
+        self.stdout.write(
+            "\n".join(
+                [
+                    "Seed completed successfully.",
+                    f"Admin: admin-00000001 / {password}",
+                    f"Employee: anna.kowalska / {password}",
+                    f"Client: klient-00000001 / {password}",
+                    self.style.SUCCESS("Data seeding completed."),
+                ]
+            )
+        )
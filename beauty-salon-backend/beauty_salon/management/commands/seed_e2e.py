@@ -2,6 +2,8 @@ from datetime import timedelta
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
 from django.utils import timezone
 
 from beauty_salon.models import (
@@ -27,6 +29,16 @@ OPENING_HOURS = {
 
 WEEKLY_HOURS = OPENING_HOURS
 
+E2E_SERVICE = {
+    "category": "E2E",
+    "description": "Deterministyczna usługa do testów E2E.",
+    "price": "100.00",
+    "duration_minutes": 30,
+    "is_active": True,
+}
+E2E_EMPLOYEE_PROFILE = {"first_name": "E2E", "last_name": "Pracownik", "is_active": True}
+E2E_CLIENT_PROFILE = {"first_name": "E2E", "last_name": "Klient", "is_active": True}
+
 
 class Command(BaseCommand):
     help = (
@@ -39,87 +51,85 @@ class Command(BaseCommand):
         parser.add_argument("--password", default="E2Epass123!")
         parser.add_argument("--cleanup-days", type=int, default=60)
 
+    @transaction.atomic
     def handle(self, *args, **options):
         base_username = options["username"]
         password = options["password"]
         cleanup_days = options["cleanup_days"]
 
         User = get_user_model()
+        Role = getattr(User, "Role", None)
+        employee_role = Role.EMPLOYEE if Role else "EMPLOYEE"
+        client_role = Role.CLIENT if Role else "CLIENT"
+        # One PBKDF2 run for every E2E account; they all share the same password.
+        hashed_password = make_password(password)
 
-        settings_obj = SystemSettings.get_settings()
+        settings_obj, _ = SystemSettings.objects.get_or_create(pk=1)
         settings_obj.opening_hours = OPENING_HOURS
         settings_obj.slot_minutes = 15
         settings_obj.buffer_minutes = 0
-        settings_obj.save()
+        settings_obj.save(
+            update_fields=[
+                "opening_hours",
+                "slot_minutes",
+                "buffer_minutes",
+                "updated_at",
+            ]
+        )
         service, service_created = Service.objects.get_or_create(
-            name="E2E - Usługa testowa",
-            defaults={
-                "category": "E2E",
-                "description": "Deterministyczna usługa do testów E2E.",
-                "price": "100.00",
-                "duration_minutes": 30,
-                "is_active": True,
-            },
+            name="E2E - Usługa testowa", defaults=E2E_SERVICE
         )
-        changed_service = False
-        if service.category != "E2E":
-            service.category = "E2E"
-            changed_service = True
-        if service.description != "Deterministyczna usługa do testów E2E.":
-            service.description = "Deterministyczna usługa do testów E2E."
-            changed_service = True
-        if str(service.price) != "100.00":
-            service.price = "100.00"
-            changed_service = True
-        if service.duration_minutes != 30:
-            service.duration_minutes = 30
-            changed_service = True
-        if not service.is_active:
-            service.is_active = True
-            changed_service = True
-        if changed_service:
-            service.save()
+        if not service_created:
+            # Single UPDATE that matches nothing when the row is already in shape.
+            Service.objects.filter(pk=service.pk).exclude(**E2E_SERVICE).update(
+                **E2E_SERVICE, updated_at=timezone.now()
+            )
 
         emp_username = "pracownik-00000001"
         emp_user, emp_user_created = User.objects.get_or_create(username=emp_username)
-        emp_user.set_password(password)
+        emp_user.password = hashed_password
         emp_user.is_active = True
-        emp_user.role = getattr(User, "Role", None).EMPLOYEE if hasattr(User, "Role") else "EMPLOYEE"
-        emp_user.save()
+        emp_user.role = employee_role
+        emp_user.save(update_fields=["password", "is_active", "role"])
 
         emp_profile, emp_profile_created = EmployeeProfile.objects.get_or_create(
-            user=emp_user,
-            defaults={"first_name": "E2E", "last_name": "Pracownik", "is_active": True},
+            user=emp_user, defaults=E2E_EMPLOYEE_PROFILE
+        )
+        if not emp_profile_created:
+            EmployeeProfile.objects.filter(pk=emp_profile.pk).exclude(
+                **E2E_EMPLOYEE_PROFILE
+            ).update(**E2E_EMPLOYEE_PROFILE, updated_at=timezone.now())
+
+        EmployeeSkill = EmployeeProfile.skills.through
+        EmployeeSkill.objects.bulk_create(
+            [EmployeeSkill(employeeprofile_id=emp_profile.pk, service_id=service.pk)],
+            ignore_conflicts=True,
         )
-        changed_emp = False
-        if getattr(emp_profile, "first_name", None) != "E2E":
-            emp_profile.first_name = "E2E"
-            changed_emp = True
-        if getattr(emp_profile, "last_name", None) != "Pracownik":
-            emp_profile.last_name = "Pracownik"
-            changed_emp = True
-        if hasattr(emp_profile, "is_active") and not emp_profile.is_active:
-            emp_profile.is_active = True
-            changed_emp = True
-        if changed_emp:
-            emp_profile.save()
-
-        emp_profile.skills.add(service)
 
         schedule, schedule_created = EmployeeSchedule.objects.get_or_create(employee=emp_profile)
         schedule.weekly_hours = WEEKLY_HOURS
-        schedule.save()
+        schedule.save(update_fields=["weekly_hours", "updated_at"])
 
         now = timezone.now()
         window_end = now + timedelta(days=cleanup_days)
 
-        deleted_appointments = Appointment.objects.filter(
-            employee=emp_profile,
-            start__gte=now - timedelta(days=1),
-            start__lte=window_end,
-        ).delete()[0]
+        # Plain DELETEs instead of QuerySet.delete(): nothing references these
+        # tables and no delete signals are hooked, so the collector's PK fetch
+        # and cascade walk are pure overhead here.
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {qn(Appointment._meta.db_table)} "
+                "WHERE employee_id = %s AND start >= %s AND start <= %s",
+                [emp_profile.pk, now - timedelta(days=1), window_end],
+            )
+            deleted_appointments = cursor.rowcount
 
-        deleted_timeoffs = TimeOff.objects.filter(employee=emp_profile).delete()[0]
+            cursor.execute(
+                f"DELETE FROM {qn(TimeOff._meta.db_table)} WHERE employee_id = %s",
+                [emp_profile.pk],
+            )
+            deleted_timeoffs = cursor.rowcount
 
         usernames = [
             base_username,
@@ -128,40 +138,35 @@ class Command(BaseCommand):
             f"{base_username}-mobile",
         ]
 
-        created_any_user = False
-        created_profiles = 0
-        fixed_profiles = 0
-
-        for username in usernames:
-            user, created = User.objects.get_or_create(username=username)
-            created_any_user = created_any_user or created
-
-            user.set_password(password)
+        client_users = User.objects.in_bulk(usernames, field_name="username")
+        for user in client_users.values():
+            user.password = hashed_password
             user.is_active = True
-            user.role = getattr(User, "Role", None).CLIENT if hasattr(User, "Role") else "CLIENT"
-            user.save()
+            user.role = client_role
+        User.objects.bulk_update(client_users.values(), ["password", "is_active", "role"])
 
-            profile, prof_created = ClientProfile.objects.get_or_create(
-                user=user,
-                defaults={"first_name": "E2E", "last_name": "Klient", "is_active": True},
-            )
+        missing_users = [
+            User(username=username, password=hashed_password, is_active=True, role=client_role)
+            for username in usernames
+            if username not in client_users
+        ]
+        User.objects.bulk_create(missing_users)
+        created_any_user = bool(missing_users)
+        client_users.update((user.username, user) for user in missing_users)
+
+        existing_profiles = ClientProfile.objects.filter(user__in=client_users.values())
+        profiled_user_ids = set(existing_profiles.values_list("user_id", flat=True))
+        fixed_profiles = existing_profiles.exclude(**E2E_CLIENT_PROFILE).update(
+            **E2E_CLIENT_PROFILE, updated_at=timezone.now()
+        )
 
-            if prof_created:
+        created_profiles = 0
+        for username in usernames:
+            user = client_users[username]
+            if user.pk not in profiled_user_ids:
+                # Created one by one so the pre_save signal assigns client_number.
+                ClientProfile.objects.create(user=user, **E2E_CLIENT_PROFILE)
                 created_profiles += 1
-            else:
-                changed = False
-                if hasattr(profile, "is_active") and not profile.is_active:
-                    profile.is_active = True
-                    changed = True
-                if getattr(profile, "first_name", None) != "E2E":
-                    profile.first_name = "E2E"
-                    changed = True
-                if getattr(profile, "last_name", None) != "Klient":
-                    profile.last_name = "Klient"
-                    changed = True
-                if changed:
-                    profile.save()
-                    fixed_profiles += 1
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beauty_salon', '0016_alter_appointment_client'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['start'], include=('status',), name='appointment_start_cover_idx'),
+        ),
+    ]
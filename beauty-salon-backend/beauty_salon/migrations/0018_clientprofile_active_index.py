@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-17 06:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beauty_salon', '0017_appointment_start_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clientprofile',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['id'], name='client_active_id_idx'),
+        ),
+    ]
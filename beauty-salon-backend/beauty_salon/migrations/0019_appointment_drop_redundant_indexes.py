@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 06:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beauty_salon', '0018_clientprofile_active_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='client',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='appointments', to='beauty_salon.clientprofile'),
+        ),
+        migrations.AlterField(
+            model_name='appointment',
+            name='employee',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='appointments', to='beauty_salon.employeeprofile'),
+        ),
+        migrations.AlterField(
+            model_name='appointment',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Oczekująca'), ('CONFIRMED', 'Potwierdzona'), ('COMPLETED', 'Zakończona'), ('CANCELLED', 'Anulowana'), ('NO_SHOW', 'Nieobecność (no-show)')], default='PENDING', max_length=20),
+        ),
+    ]
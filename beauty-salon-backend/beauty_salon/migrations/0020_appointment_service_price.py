@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-17 06:48
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def forwards_fill_service_price(apps, schema_editor):
+
+    Appointment = apps.get_model("beauty_salon", "Appointment")
+    Service = apps.get_model("beauty_salon", "Service")
+
+    Appointment.objects.filter(
+        service__isnull=False, service_price__isnull=True
+    ).update(
+        service_price=Subquery(
+            Service.objects.filter(pk=OuterRef("service_id")).values("price")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beauty_salon', '0019_appointment_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='service_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.RunPython(forwards_fill_service_price, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beauty_salon', '0020_appointment_service_price'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='service',
+            name='category',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-17 07:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beauty_salon', '0022_systemlog_drop_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='appointment',
+            name='beauty_salo_employe_a52646_idx',
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['employee', 'start'], include=('end', 'status'), name='appointment_employee_cover_idx'),
+        ),
+    ]
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import re
+import time
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.db.models import F, Q, UniqueConstraint
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -114,7 +116,7 @@ class CustomUser(AbstractUser):
 
 class Service(models.Model):
     name = models.CharField(max_length=255, unique=True)
-    category = models.CharField(max_length=100, blank=True, db_index=True)
+    category = models.CharField(max_length=100, blank=True)
     description = models.TextField(blank=True)
     price = models.DecimalField(
         max_digits=10, decimal_places=2, validators=[MinValueValidator(0)]
@@ -216,6 +218,11 @@ class ClientProfile(models.Model):
         indexes = [
             models.Index(fields=["client_number"]),
             models.Index(fields=["last_name", "first_name"]),
+            models.Index(
+                fields=["id"],
+                condition=Q(is_active=True),
+                name="client_active_id_idx",
+            ),
         ]
         verbose_name = _("Profil klienta")
         verbose_name_plural = _("Profile klientów")
@@ -406,18 +413,33 @@ class Appointment(models.Model):
         null=False,
         blank=False,
         related_name="appointments",
+        # Covered by the (client, start) index in Meta.
+        db_index=False,
     )
 
     employee = models.ForeignKey(
-        EmployeeProfile, on_delete=models.CASCADE, related_name="appointments"
+        EmployeeProfile,
+        on_delete=models.CASCADE,
+        related_name="appointments",
+        # Covered by the (employee, start) index in Meta.
+        db_index=False,
     )
     service = models.ForeignKey(
         Service, on_delete=models.SET_NULL, null=True, related_name="appointments"
     )
+    # Price at booking time, so revenue reports neither join Service nor
+    # shift when the price list changes.
+    service_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(0)],
+    )
     start = models.DateTimeField()
     end = models.DateTimeField()
     status = models.CharField(
-        max_length=20, choices=Status.choices, default=Status.PENDING, db_index=True
+        max_length=20, choices=Status.choices, default=Status.PENDING
     )
     internal_notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -437,7 +459,18 @@ class Appointment(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=["employee", "start"]),
+            # status rides along so the date-window counts in reports and
+            # dashboards can be answered by an index-only scan.
+            models.Index(
+                fields=["start"], include=["status"], name="appointment_start_cover_idx"
+            ),
+            # Overlap checks and the availability scan only need end and
+            # status besides the key, so they can skip the heap.
+            models.Index(
+                fields=["employee", "start"],
+                include=["end", "status"],
+                name="appointment_employee_cover_idx",
+            ),
             models.Index(fields=["status", "start"]),
             models.Index(fields=["client", "start"]),
         ]
@@ -448,6 +481,32 @@ class Appointment(models.Model):
         client_name = self.client.get_full_name() if self.client else "Walk-in"
         return f"{client_name} - {self.start:%Y-%m-%d %H:%M}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if "service_id" in instance.__dict__:
+            instance._loaded_service_id = instance.service_id
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        if self._state.adding:
+            if self.service_price is None and self.service:
+                self.service_price = self.service.price
+        elif self._service_changed(kwargs.get("update_fields")):
+            self.service_price = self.service.price if self.service else None
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "service_price"}
+        super().save(*args, **kwargs)
+        self._loaded_service_id = self.service_id
+
+    def _service_changed(self, update_fields) -> bool:
+        if update_fields is not None and not {"service", "service_id"} & set(
+            update_fields
+        ):
+            return False
+        loaded = self.__dict__.get("_loaded_service_id", self.service_id)
+        return self.service_id != loaded
+
     def clean(self) -> None:
         super().clean()
         if self.start and timezone.is_naive(self.start):
@@ -519,16 +578,70 @@ class SystemSettings(models.Model):
     def __str__(self) -> str:
         return f"System settings (updated: {self.updated_at.date()})"
 
+    CACHE_VERSION_KEY = "system_settings_version"
+    # Kept short: without a shared CACHES backend the version counter is per
+    # process too, so other workers only see an update once their copy expires.
+    CACHE_TIMEOUT = 300
+    # (version, expires_at, row) memoised per process; a steady-state read is
+    # one integer GET from the cache plus a clock check.
+    _cached_settings: tuple[int, float, SystemSettings] | None = None
+
     def save(self, *args, **kwargs) -> None:
         self.pk = 1
         super().save(*args, **kwargs)
+        self.invalidate_cache()
 
     def delete(self, *args, **kwargs):
         raise ValidationError(_("Nie można usunąć ustawień systemu."))
 
+    @classmethod
+    def _cache_version(cls) -> int:
+        version = cache.get(cls.CACHE_VERSION_KEY)
+        if version is None:
+            # Seed from the clock so a counter lost to eviction never comes
+            # back with a value an old process-local copy was stored under.
+            cache.add(cls.CACHE_VERSION_KEY, time.time_ns(), None)
+            version = cache.get(cls.CACHE_VERSION_KEY)
+        return version
+
+    @classmethod
+    def _bump_cache_version(cls) -> None:
+        try:
+            cache.incr(cls.CACHE_VERSION_KEY)
+        except ValueError:
+            cache.add(cls.CACHE_VERSION_KEY, time.time_ns(), None)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        cls._bump_cache_version()
+        # Readers outside this transaction may memoise the old row before we
+        # commit; bump again once the new values are visible.
+        transaction.on_commit(cls._bump_cache_version)
+
     @classmethod
     def get_settings(cls) -> SystemSettings:
-        obj, _ = cls.objects.get_or_create(pk=1)
+        version = cls._cache_version()
+        cached = cls._cached_settings
+        if (
+            cached is not None
+            and cached[0] == version
+            and cached[1] > time.monotonic()
+        ):
+            # Shared, read-only instance: writers load their own row.
+            return cached[2]
+
+        obj, created = cls.objects.get_or_create(pk=1)
+        # Never memoise a row read inside a transaction: it may hold
+        # uncommitted changes that are later rolled back.
+        if not transaction.get_connection().in_atomic_block:
+            if created:
+                # Creating the row already bumped the version read above.
+                version = cls._cache_version()
+            cls._cached_settings = (
+                version,
+                time.monotonic() + cls.CACHE_TIMEOUT,
+                obj,
+            )
         return obj
 
 
@@ -563,13 +676,15 @@ class SystemLog(models.Model):
 
         SETTINGS_UPDATED = "SETTINGS_UPDATED", _("Zaktualizowano ustawienia systemu")
 
-    action = models.CharField(max_length=40, choices=Action.choices, db_index=True)
+    # action and performed_by are covered by the (..., timestamp) indexes in Meta.
+    action = models.CharField(max_length=40, choices=Action.choices)
     performed_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
         blank=True,
         null=True,
         related_name="system_logs",
+        db_index=False,
     )
     target_user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -342,17 +342,28 @@ class EmployeeSerializer(serializers.ModelSerializer):
             if user.username != final_username:
                 if User.objects.filter(username=final_username).exclude(pk=user.pk).exists():
                     base = int(employee.employee_number)
-                    picked = None
-                    for _ in range(1000):
-                        base += 1
-                        candidate_num = f"{base:08d}"
-                        candidate_username = f"pracownik-{candidate_num}"
-                        if (
-                            not EmployeeProfile.objects.filter(employee_number=candidate_num).exists()
-                            and not User.objects.filter(username=candidate_username).exclude(pk=user.pk).exists()
-                        ):
-                            picked = (candidate_num, candidate_username)
-                            break
+                    candidates = [
+                        (f"{n:08d}", f"pracownik-{n:08d}") for n in range(base + 1, base + 1001)
+                    ]
+                    taken_numbers = set(
+                        EmployeeProfile.objects.filter(
+                            employee_number__in=[num for num, _ in candidates]
+                        ).values_list("employee_number", flat=True)
+                    )
+                    taken_usernames = set(
+                        User.objects.filter(username__in=[uname for _, uname in candidates])
+                        .exclude(pk=user.pk)
+                        .values_list("username", flat=True)
+                    )
+                    picked = next(
+                        (
+                            (candidate_num, candidate_username)
+                            for candidate_num, candidate_username in candidates
+                            if candidate_num not in taken_numbers
+                            and candidate_username not in taken_usernames
+                        ),
+                        None,
+                    )
 
                     if not picked:
                         raise serializers.ValidationError("Nie można wygenerować unikalnego loginu pracownika.")
@@ -377,32 +388,32 @@ class EmployeeSerializer(serializers.ModelSerializer):
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, "updated_at"])
 
         if skills_data is not None:
             instance.skills.set(skills_data)
 
         user = instance.user
-        user_changed = False
+        user_fields = []
 
         if "first_name" in validated_data:
             user.first_name = instance.first_name
-            user_changed = True
+            user_fields.append("first_name")
         if "last_name" in validated_data:
             user.last_name = instance.last_name
-            user_changed = True
+            user_fields.append("last_name")
 
         if email is not None:
             user.email = email
-            user_changed = True
+            user_fields.append("email")
 
         if password:
             user.set_password(password)
-            user_changed = True
+            user_fields.append("password")
 
-        if user_changed:
+        if user_fields:
             user.full_clean()
-            user.save()
+            user.save(update_fields=user_fields)
 
         return instance
 
@@ -655,17 +666,28 @@ class ClientSerializer(serializers.ModelSerializer):
             if user.username != final_username:
                 if User.objects.filter(username=final_username).exclude(pk=user.pk).exists():
                     base = int(client.client_number)
-                    picked = None
-                    for _ in range(1000):
-                        base += 1
-                        candidate_num = f"{base:08d}"
-                        candidate_username = f"klient-{candidate_num}"
-                        if (
-                            not ClientProfile.objects.filter(client_number=candidate_num).exists()
-                            and not User.objects.filter(username=candidate_username).exclude(pk=user.pk).exists()
-                        ):
-                            picked = (candidate_num, candidate_username)
-                            break
+                    candidates = [
+                        (f"{n:08d}", f"klient-{n:08d}") for n in range(base + 1, base + 1001)
+                    ]
+                    taken_numbers = set(
+                        ClientProfile.objects.filter(
+                            client_number__in=[num for num, _ in candidates]
+                        ).values_list("client_number", flat=True)
+                    )
+                    taken_usernames = set(
+                        User.objects.filter(username__in=[uname for _, uname in candidates])
+                        .exclude(pk=user.pk)
+                        .values_list("username", flat=True)
+                    )
+                    picked = next(
+                        (
+                            (candidate_num, candidate_username)
+                            for candidate_num, candidate_username in candidates
+                            if candidate_num not in taken_numbers
+                            and candidate_username not in taken_usernames
+                        ),
+                        None,
+                    )
 
                     if not picked:
                         raise serializers.ValidationError("Nie można wygenerować unikalnego loginu klienta.")
@@ -685,30 +707,30 @@ class ClientSerializer(serializers.ModelSerializer):
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, "updated_at"])
 
         user = instance.user
         if user:
-            user_changed = False
+            user_fields = []
 
             if "first_name" in validated_data:
                 user.first_name = instance.first_name
-                user_changed = True
+                user_fields.append("first_name")
             if "last_name" in validated_data:
                 user.last_name = instance.last_name
-                user_changed = True
+                user_fields.append("last_name")
 
             if "email" in validated_data:
                 user.email = instance.email or ""
-                user_changed = True
+                user_fields.append("email")
 
             if password:
                 user.set_password(password)
-                user_changed = True
+                user_fields.append("password")
 
-            if user_changed:
+            if user_fields:
                 user.full_clean()
-                user.save()
+                user.save(update_fields=user_fields)
 
         return instance
 
@@ -734,7 +756,6 @@ class AppointmentSerializer(serializers.ModelSerializer):
     client_name = serializers.CharField(source="client.get_full_name", read_only=True)
     employee_name = serializers.CharField(source="employee.get_full_name", read_only=True)
     service_name = serializers.CharField(source="service.name", read_only=True)
-    service_price = serializers.DecimalField(source="service.price", max_digits=10, decimal_places=2, read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
 
     can_confirm = serializers.SerializerMethodField()
@@ -765,7 +786,7 @@ class AppointmentSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "service_price", "created_at", "updated_at"]
 
     def get_can_confirm(self, obj) -> bool:
         request = self.context.get("request")
@@ -866,6 +887,12 @@ class AppointmentSerializer(serializers.ModelSerializer):
 
         return attrs
 
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
+
 
 class SystemSettingsSerializer(serializers.ModelSerializer):
     updated_by_username = serializers.CharField(source="updated_by.username", read_only=True, allow_null=True)
@@ -1044,32 +1071,22 @@ class BookingCreateSerializer(serializers.Serializer):
                 {"non_field_errors": "Wybrany termin jest niedostępny."}
             )
 
-        conflicting_employee_appointments = list(
-            Appointment.objects.select_for_update()
-            .filter(
-                employee=employee,
-                start__lt=end,
-                end__gt=start,
-                status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-            )[:1]
-        )
-
-        if conflicting_employee_appointments:
+        if Appointment.objects.filter(
+            employee=employee,
+            start__lt=end,
+            end__gt=start,
+            status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
+        ).exists():
             raise serializers.ValidationError(
                 {"non_field_errors": "Wybrany termin jest już zajęty."}
             )
 
-        conflicting_client_appointments = list(
-            Appointment.objects.select_for_update()
-            .filter(
-                client=client,
-                start__lt=end,
-                end__gt=start,
-                status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-            )[:1]
-        )
-
-        if conflicting_client_appointments:
+        if Appointment.objects.filter(
+            client=client,
+            start__lt=end,
+            end__gt=start,
+            status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
+        ).exists():
             raise serializers.ValidationError(
                 {"non_field_errors": "Klient ma już zarezerwowaną wizytę w tym czasie."}
             )
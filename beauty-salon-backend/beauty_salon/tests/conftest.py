@@ -8,6 +8,14 @@ from datetime import timedelta
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def admin_user(db):
     user = baker.make(
@@ -1,7 +1,8 @@
 import pytest
 from rest_framework import status
 from django.utils import timezone
-from datetime import timedelta
+from datetime import datetime, time, timedelta
+from decimal import Decimal
 from model_bakery import baker
 
 
@@ -133,6 +134,37 @@ class TestAppointmentsAPI:
         )
         assert response.status_code == status.HTTP_200_OK
 
+    def test_update_appointment_service_refreshes_price(self, admin_api_client, appointment):
+        other = baker.make("beauty_salon.Service", name="Microblading", price="400.00", duration_minutes=60)
+
+        response = admin_api_client.patch(
+            f"/api/appointments/{appointment.id}/",
+            {"service": other.id, "status": appointment.status},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["service_price"] == "400.00"
+
+        appointment.refresh_from_db()
+        assert str(appointment.service_price) == "400.00"
+
+    def test_update_with_same_service_keeps_booked_price(self, admin_api_client, appointment):
+        booked_price = Decimal(appointment.service_price)
+        appointment.service.price = "999.00"
+        appointment.service.save()
+
+        response = admin_api_client.patch(
+            f"/api/appointments/{appointment.id}/",
+            {
+                "service": appointment.service.id,
+                "status": appointment.status,
+                "internal_notes": "Przesunięta",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        appointment.refresh_from_db()
+        assert appointment.service_price == booked_price
+
     def test_client_cannot_see_other_appointments(self, client_api_client, db, client_profile):
         from beauty_salon.models import ClientProfile, EmployeeProfile, CustomUser
 
@@ -182,6 +214,47 @@ class TestAppointmentsAPI:
         assert "slots" in response.data
         assert isinstance(response.data["slots"], list)
 
+    def test_available_slots_skip_busy_intervals(
+        self, admin_api_client, employee_profile, client_profile, service, employee_schedule
+    ):
+        day = (timezone.localtime() + timedelta(days=7)).date()
+        while day.weekday() != 0:
+            day += timedelta(days=1)
+
+        busy = []
+        for start_time, minutes, status_value in (
+            (time(10, 0), 60, "PENDING"),
+            (time(10, 30), 90, "CONFIRMED"),
+            (time(14, 0), 30, "CANCELLED"),
+        ):
+            start = timezone.make_aware(datetime.combine(day, start_time))
+            end = start + timedelta(minutes=minutes)
+            baker.make(
+                "beauty_salon.Appointment",
+                client=client_profile,
+                employee=employee_profile,
+                service=service,
+                start=start,
+                end=end,
+                status=status_value,
+            )
+            if status_value != "CANCELLED":
+                busy.append((start, end))
+
+        response = admin_api_client.get(
+            f"/api/availability/slots/?employee_id={employee_profile.id}&service_id={service.id}&date={day}"
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        slots = [
+            (datetime.fromisoformat(s["start"]), datetime.fromisoformat(s["end"]))
+            for s in response.data["slots"]
+        ]
+        assert slots
+        for s_start, s_end in slots:
+            assert not any(b_start < s_end and b_end > s_start for b_start, b_end in busy)
+        assert timezone.make_aware(datetime.combine(day, time(14, 0))) in [s for s, _ in slots]
+
     def test_create_appointment_past_date_fails(self, client_api_client, service, employee_profile):
         past = timezone.now() - timedelta(hours=1)
         data = {
@@ -35,6 +35,25 @@ class TestDashboardAndReportsAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["role"] == "EMPLOYEE"
 
+    def test_dashboard_employee_counts(
+        self, employee_api_client, confirmed_appointment, service, employee_profile, client_profile
+    ):
+        month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        baker.make(
+            "beauty_salon.Appointment",
+            employee=employee_profile,
+            client=client_profile,
+            service=service,
+            start=month_start,
+            end=month_start + timedelta(minutes=service.duration_minutes),
+            status="COMPLETED",
+        )
+
+        response = employee_api_client.get("/api/dashboard/")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["upcoming"]["count"] == 1
+        assert response.data["this_month"]["completed_appointments"] == 1
+
     def test_dashboard_client(self, client_api_client):
         response = client_api_client.get("/api/dashboard/")
         assert response.status_code == status.HTTP_200_OK
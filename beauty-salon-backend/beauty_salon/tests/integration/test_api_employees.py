@@ -21,6 +21,28 @@ class TestEmployeesAPI:
         response = admin_api_client.post('/api/employees/', data)
         assert response.status_code in [status.HTTP_201_CREATED, status.HTTP_400_BAD_REQUEST]
     
+    def test_create_employee_skips_taken_usernames(self, admin_api_client):
+        from beauty_salon.models import CustomUser, EmployeeProfile
+        from model_bakery import baker
+
+        next_num = int(EmployeeProfile.objects.order_by('-employee_number').values_list('employee_number', flat=True).first() or 0) + 1
+        for offset in range(2):
+            baker.make(CustomUser, username=f'pracownik-{next_num + offset:08d}', role='EMPLOYEE')
+
+        data = {
+            'first_name': 'Collision',
+            'last_name': 'Employee',
+            'phone': '+48123456780',
+            'email': 'collision@test.com',
+            'password': 'StrongPass123!'
+        }
+        response = admin_api_client.post('/api/employees/', data)
+        assert response.status_code == status.HTTP_201_CREATED, response.data
+
+        employee = EmployeeProfile.objects.get(first_name='Collision')
+        assert employee.employee_number == f'{next_num + 2:08d}'
+        assert employee.user.username == f'pracownik-{next_num + 2:08d}'
+    
     def test_get_employee_details(self, admin_api_client, employee_profile):
         response = admin_api_client.get(f'/api/employees/{employee_profile.id}/')
         assert response.status_code == status.HTTP_200_OK
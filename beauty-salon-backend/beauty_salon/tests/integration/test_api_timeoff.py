@@ -1,4 +1,7 @@
 import pytest
+from datetime import datetime, timedelta
+from django.utils import timezone
+from model_bakery import baker
 from rest_framework import status
 
 @pytest.mark.integration
@@ -24,6 +27,38 @@ class TestTimeOffAPI:
         response = admin_api_client.post(f'/api/time-offs/{pending_timeoff.id}/approve/')
         assert response.status_code == status.HTTP_200_OK
     
+    def test_approve_timeoff_blocked_by_late_appointment_on_last_day(
+        self, admin_api_client, pending_timeoff, client_profile, service
+    ):
+        start = timezone.make_aware(datetime(2025, 2, 5, 23, 30))
+        baker.make(
+            'beauty_salon.Appointment',
+            client=client_profile,
+            employee=pending_timeoff.employee,
+            service=service,
+            start=start,
+            end=start + timedelta(minutes=20),
+            status='CONFIRMED'
+        )
+        response = admin_api_client.post(f'/api/time-offs/{pending_timeoff.id}/approve/')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_approve_timeoff_ignores_appointment_after_last_day(
+        self, admin_api_client, pending_timeoff, client_profile, service
+    ):
+        start = timezone.make_aware(datetime(2025, 2, 6, 0, 0))
+        baker.make(
+            'beauty_salon.Appointment',
+            client=client_profile,
+            employee=pending_timeoff.employee,
+            service=service,
+            start=start,
+            end=start + timedelta(minutes=60),
+            status='CONFIRMED'
+        )
+        response = admin_api_client.post(f'/api/time-offs/{pending_timeoff.id}/approve/')
+        assert response.status_code == status.HTTP_200_OK
+    
     def test_reject_timeoff_admin(self, admin_api_client, pending_timeoff):
         response = admin_api_client.post(f'/api/time-offs/{pending_timeoff.id}/reject/')
         assert response.status_code == status.HTTP_200_OK
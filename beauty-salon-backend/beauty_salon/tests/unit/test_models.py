@@ -1,5 +1,7 @@
 import pytest
+import time
 from datetime import timedelta
+from decimal import Decimal
 from django.utils import timezone
 from model_bakery import baker
 
@@ -81,6 +83,24 @@ class TestAppointmentModel:
         appointment.refresh_from_db()
         assert appointment.status == "CONFIRMED"
 
+    def test_appointment_keeps_price_from_booking_time(self, appointment):
+        booked_price = Decimal(appointment.service.price)
+        appointment.service.price = booked_price + 50
+        appointment.service.save()
+
+        appointment.refresh_from_db()
+        assert appointment.service_price == booked_price
+
+    def test_appointment_takes_price_of_new_service(self, appointment):
+        other = baker.make("beauty_salon.Service", name="Microblading", price=Decimal("400.00"))
+
+        appointment = type(appointment).objects.get(pk=appointment.pk)
+        appointment.service = other
+        appointment.save(update_fields=["service", "updated_at"])
+
+        appointment.refresh_from_db()
+        assert appointment.service_price == Decimal("400.00")
+
 
 @pytest.mark.unit
 @pytest.mark.django_db
@@ -157,3 +177,39 @@ class TestTimeOffModel:
         pending_timeoff.refresh_from_db()
         assert pending_timeoff.status == "APPROVED"
         assert pending_timeoff.decided_by == admin_user
+
+
+@pytest.mark.unit
+@pytest.mark.django_db(transaction=True)
+class TestSystemSettingsModel:
+
+    def test_get_settings_is_cached(self, django_assert_num_queries):
+        from beauty_salon.models import SystemSettings
+        SystemSettings.get_settings()
+
+        with django_assert_num_queries(0):
+            assert SystemSettings.get_settings().pk == 1
+
+    def test_save_invalidates_cached_settings(self):
+        from beauty_salon.models import SystemSettings
+        SystemSettings.get_settings()
+        settings_obj = SystemSettings.objects.get(pk=1)
+        settings_obj.slot_minutes = 30
+        settings_obj.save()
+
+        assert SystemSettings.get_settings().slot_minutes == 30
+
+    def test_cached_settings_expire(self, monkeypatch):
+        from beauty_salon.models import SystemSettings
+        SystemSettings.get_settings()
+        # Simulates a save made by another worker that this process's
+        # cache never heard about.
+        SystemSettings.objects.filter(pk=1).update(slot_minutes=20)
+
+        assert SystemSettings.get_settings().slot_minutes != 20
+
+        now = time.monotonic()
+        monkeypatch.setattr(
+            time, "monotonic", lambda: now + SystemSettings.CACHE_TIMEOUT + 1
+        )
+        assert SystemSettings.get_settings().slot_minutes == 20
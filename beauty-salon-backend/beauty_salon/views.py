@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import io
 import os
+from bisect import bisect_left
 from datetime import datetime, time, timedelta
 from decimal import Decimal
+from itertools import accumulate
 
 
 from django.conf import settings
@@ -212,7 +213,11 @@ class ServiceViewSet(viewsets.ModelViewSet):
 
 
 class EmployeeViewSet(viewsets.ModelViewSet):
-    queryset = EmployeeProfile.objects.all().prefetch_related("skills").order_by("id")
+    queryset = (
+        EmployeeProfile.objects.select_related("user")
+        .prefetch_related("skills")
+        .order_by("id")
+    )
     serializer_class = EmployeeSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -248,7 +253,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
             ),
             revenue_completed_total=Coalesce(
                 Sum(
-                    "appointments__service__price",
+                    "appointments__service_price",
                     filter=Q(appointments__status=Appointment.Status.COMPLETED),
                 ),
                 Decimal("0.00"),
@@ -457,15 +462,16 @@ class TimeOffViewSet(viewsets.ModelViewSet):
                 {"detail": "Można akceptować tylko wnioski PENDING."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        range_start, range_end = _local_day_range(obj.date_from, obj.date_to)
         conflicting_appointments = Appointment.objects.filter(
             employee=obj.employee,
-            start__date__gte=obj.date_from,
-            start__date__lte=obj.date_to,
+            start__gte=range_start,
+            start__lt=range_end,
             status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
         )
 
-        if conflicting_appointments.exists():
-            count = conflicting_appointments.count()
+        count = conflicting_appointments.count()
+        if count:
             return Response(
                 {
                     "detail": f"Nie można zaakceptować urlopu. Pracownik ma {count} aktywnych wizyt w tym okresie. "
@@ -550,7 +556,11 @@ class TimeOffViewSet(viewsets.ModelViewSet):
         return Response(TimeOffSerializer(obj, context={"request": request}).data)
 
 class ClientViewSet(viewsets.ModelViewSet):
-    queryset = ClientProfile.objects.filter(is_active=True).order_by("id")
+    queryset = (
+        ClientProfile.objects.filter(is_active=True)
+        .select_related("user")
+        .order_by("id")
+    )
     serializer_class = ClientSerializer
     filter_backends = [
         DjangoFilterBackend,
@@ -891,7 +901,8 @@ class SystemSettingsView(APIView):
         )
 
     def patch(self, request):
-        obj = SystemSettings.get_settings()
+        # get_settings() hands out the shared memoised instance; edit a fresh row.
+        obj, _ = SystemSettings.objects.get_or_create(pk=1)
         ser = SystemSettingsSerializer(
             obj, data=request.data, partial=True, context={"request": request}
         )
@@ -910,8 +921,23 @@ def _parse_hhmm(hhmm: str) -> time:
     return datetime.strptime(hhmm, "%H:%M").time()
 
 
+def _local_day_range(first_day, last_day=None) -> tuple[datetime, datetime]:
+    """Aware [start, end) bounds covering whole local days, for start__gte/start__lt.
+
+    Unlike start__date lookups, a plain range on the column can use its index.
+    """
+    last_day = last_day or first_day
+    return (
+        timezone.make_aware(datetime.combine(first_day, time.min)),
+        timezone.make_aware(datetime.combine(last_day + timedelta(days=1), time.min)),
+    )
+
+
+_WEEKDAY_KEYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
 def _weekday_key(d) -> str:
-    return ["mon", "tue", "wed", "thu", "fri", "sat", "sun"][d.weekday()]
+    return _WEEKDAY_KEYS[d.weekday()]
 
 
 class AvailabilitySlotsAPIView(APIView):
@@ -983,8 +1009,7 @@ class AvailabilitySlotsAPIView(APIView):
             minutes=int(service.duration_minutes) + int(buffer_minutes)
         )
 
-        day_start = timezone.make_aware(datetime.combine(day, time(0, 0)))
-        day_end = timezone.make_aware(datetime.combine(day, time(23, 59, 59)))
+        day_start, day_end = _local_day_range(day)
 
         busy = list(
             Appointment.objects.filter(
@@ -992,8 +1017,15 @@ class AvailabilitySlotsAPIView(APIView):
                 start__lt=day_end,
                 end__gt=day_start,
                 status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-            ).values_list("start", "end")
+            )
+            .order_by("start")
+            .values_list("start", "end")
         )
+        busy_starts = [b_start for b_start, _ in busy]
+        busy_max_ends = list(accumulate((b_end for _, b_end in busy), max))
+
+        now = timezone.now()
+        step = timedelta(minutes=slot_minutes)
 
         slots: list[dict] = []
         for p in periods:
@@ -1015,14 +1047,12 @@ class AvailabilitySlotsAPIView(APIView):
                 candidate_start = cursor
                 candidate_end = cursor + duration
 
-                if candidate_start < timezone.now():
-                    cursor += timedelta(minutes=slot_minutes)
+                if candidate_start < now:
+                    cursor += step
                     continue
 
-                overlap = any(
-                    b_start < candidate_end and b_end > candidate_start
-                    for b_start, b_end in busy
-                )
+                idx = bisect_left(busy_starts, candidate_end)
+                overlap = idx > 0 and busy_max_ends[idx - 1] > candidate_start
                 if not overlap:
                     slots.append(
                         {
@@ -1031,7 +1061,7 @@ class AvailabilitySlotsAPIView(APIView):
                         }
                     )
 
-                cursor += timedelta(minutes=slot_minutes)
+                cursor += step
 
         return Response({"date": date_str, "slots": slots})
 
@@ -1166,16 +1196,20 @@ class DashboardView(APIView):
         today = timezone.now().date()
         now = timezone.now()
 
-        today_appointments = Appointment.objects.filter(start__date=today)
+        today_start, today_end = _local_day_range(today)
+        today_appointments = Appointment.objects.filter(
+            start__gte=today_start, start__lt=today_end
+        )
         pending_count = Appointment.objects.filter(
             status=Appointment.Status.PENDING
         ).count()
 
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        month_revenue = Appointment.objects.filter(
+        month_completed = Appointment.objects.filter(
             status=Appointment.Status.COMPLETED,
             start__gte=month_start,
-        ).aggregate(total=Sum("service__price"))["total"] or Decimal("0")
+        ).aggregate(total=Sum("service_price"), count=Count("id"))
+        month_revenue = month_completed["total"] or Decimal("0")
 
         active_employees = EmployeeProfile.objects.filter(is_active=True).count()
         active_clients = ClientProfile.objects.filter(is_active=True).count()
@@ -1187,7 +1221,9 @@ class DashboardView(APIView):
                     "date": today.isoformat(),
                     "appointments_count": today_appointments.count(),
                     "appointments": AppointmentSerializer(
-                        today_appointments.order_by("start")[:10],
+                        today_appointments.select_related(
+                            "client", "employee", "service"
+                        ).order_by("start")[:10],
                         many=True,
                         context={"request": request},
                     ).data,
@@ -1195,10 +1231,7 @@ class DashboardView(APIView):
                 "pending_appointments": pending_count,
                 "current_month": {
                     "revenue": float(month_revenue),
-                    "completed_appointments": Appointment.objects.filter(
-                        status=Appointment.Status.COMPLETED,
-                        start__gte=month_start,
-                    ).count(),
+                    "completed_appointments": month_completed["count"],
                 },
                 "system": {
                     "active_employees": active_employees,
@@ -1218,11 +1251,13 @@ class DashboardView(APIView):
         today = timezone.now()
         today_date = today.date()
 
+        today_start, today_end = _local_day_range(today_date)
         today_schedule = Appointment.objects.filter(
             employee=employee,
-            start__date=today_date,
+            start__gte=today_start,
+            start__lt=today_end,
             status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-        ).order_by("start")
+        ).select_related("client", "employee", "service").order_by("start")
 
         week_later = today + timedelta(days=7)
         upcoming = Appointment.objects.filter(
@@ -1230,14 +1265,27 @@ class DashboardView(APIView):
             start__gte=today,
             start__lte=week_later,
             status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-        ).order_by("start")
+        ).select_related("client", "employee", "service").order_by("start")
 
         month_start = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        month_completed = Appointment.objects.filter(
-            employee=employee,
-            status=Appointment.Status.COMPLETED,
-            start__gte=month_start,
-        ).count()
+        counts = Appointment.objects.filter(
+            employee=employee, start__gte=month_start
+        ).aggregate(
+            upcoming=Count(
+                "id",
+                filter=Q(
+                    start__gte=today,
+                    start__lte=week_later,
+                    status__in=[
+                        Appointment.Status.PENDING,
+                        Appointment.Status.CONFIRMED,
+                    ],
+                ),
+            ),
+            month_completed=Count(
+                "id", filter=Q(status=Appointment.Status.COMPLETED)
+            ),
+        )
 
         return Response(
             {
@@ -1251,13 +1299,13 @@ class DashboardView(APIView):
                     ).data,
                 },
                 "upcoming": {
-                    "count": upcoming.count(),
+                    "count": counts["upcoming"],
                     "appointments": AppointmentSerializer(
                         upcoming[:5], many=True, context={"request": request}
                     ).data,
                 },
                 "this_month": {
-                    "completed_appointments": month_completed,
+                    "completed_appointments": counts["month_completed"],
                 },
             }
         )
@@ -1275,16 +1323,20 @@ class DashboardView(APIView):
             client=client,
             start__gte=now,
             status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-        ).order_by("start")
+        ).select_related("client", "employee", "service").order_by("start")
 
         history_count = Appointment.objects.filter(
             client=client, status=Appointment.Status.COMPLETED
         ).count()
 
-        recent_history = Appointment.objects.filter(
-            client=client,
-            status=Appointment.Status.COMPLETED,
-        ).order_by("-start")[:3]
+        recent_history = (
+            Appointment.objects.filter(
+                client=client,
+                status=Appointment.Status.COMPLETED,
+            )
+            .select_related("client", "employee", "service")
+            .order_by("-start")[:3]
+        )
 
         return Response(
             {
@@ -1316,44 +1368,52 @@ class StatisticsView(APIView):
         thirty_days_ago = timezone.now() - timedelta(days=30)
         now = timezone.now()
 
-        total_appointments = Appointment.objects.count()
-
-        recent_appointments = Appointment.objects.filter(start__gte=thirty_days_ago)
-
-        appointments_last_30d = recent_appointments.count()
-        completed_last_30d = recent_appointments.filter(
-            status=Appointment.Status.COMPLETED
-        ).count()
-        cancelled_last_30d = recent_appointments.filter(
-            status=Appointment.Status.CANCELLED
-        ).count()
-        no_shows_last_30d = recent_appointments.filter(
-            status=Appointment.Status.NO_SHOW
-        ).count()
-
-        upcoming_appointments = Appointment.objects.filter(
-            start__gte=now,
-            status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
-        ).count()
+        recent = Q(start__gte=thirty_days_ago)
+        completed = Q(status=Appointment.Status.COMPLETED)
+        completed_recent = recent & completed
 
-        completed_recent = recent_appointments.filter(
-            status=Appointment.Status.COMPLETED
+        appointment_stats = Appointment.objects.aggregate(
+            total_appointments=Count("id"),
+            appointments_last_30d=Count("id", filter=recent),
+            completed_last_30d=Count("id", filter=completed_recent),
+            cancelled_last_30d=Count(
+                "id", filter=recent & Q(status=Appointment.Status.CANCELLED)
+            ),
+            no_shows_last_30d=Count(
+                "id", filter=recent & Q(status=Appointment.Status.NO_SHOW)
+            ),
+            upcoming_appointments=Count(
+                "id",
+                filter=Q(
+                    start__gte=now,
+                    status__in=[
+                        Appointment.Status.PENDING,
+                        Appointment.Status.CONFIRMED,
+                    ],
+                ),
+            ),
+            revenue_last_30d=Sum("service_price", filter=completed_recent),
+            avg_appointment_value=Avg("service_price", filter=completed_recent),
+            total_revenue=Sum("service_price", filter=completed),
         )
 
-        revenue_last_30d = completed_recent.aggregate(total=Sum("service__price"))[
-            "total"
-        ] or Decimal("0")
-
-        avg_appointment_value = completed_recent.aggregate(avg=Avg("service__price"))[
-            "avg"
-        ] or Decimal("0")
-
-        total_revenue = Appointment.objects.filter(
-            status=Appointment.Status.COMPLETED
-        ).aggregate(total=Sum("service__price"))["total"] or Decimal("0")
+        total_appointments = appointment_stats["total_appointments"]
+        appointments_last_30d = appointment_stats["appointments_last_30d"]
+        completed_last_30d = appointment_stats["completed_last_30d"]
+        cancelled_last_30d = appointment_stats["cancelled_last_30d"]
+        no_shows_last_30d = appointment_stats["no_shows_last_30d"]
+        upcoming_appointments = appointment_stats["upcoming_appointments"]
+        revenue_last_30d = appointment_stats["revenue_last_30d"] or Decimal("0")
+        avg_appointment_value = appointment_stats["avg_appointment_value"] or Decimal(
+            "0"
+        )
+        total_revenue = appointment_stats["total_revenue"] or Decimal("0")
 
-        total_employees = EmployeeProfile.objects.count()
-        active_employees = EmployeeProfile.objects.filter(is_active=True).count()
+        employee_stats = EmployeeProfile.objects.aggregate(
+            total=Count("id"), active=Count("id", filter=Q(is_active=True))
+        )
+        total_employees = employee_stats["total"]
+        active_employees = employee_stats["active"]
 
         employees_with_appointments = (
             EmployeeProfile.objects.filter(appointments__start__gte=thirty_days_ago)
@@ -1361,8 +1421,11 @@ class StatisticsView(APIView):
             .count()
         )
 
-        total_clients = ClientProfile.objects.count()
-        active_clients = ClientProfile.objects.filter(is_active=True).count()
+        client_stats = ClientProfile.objects.aggregate(
+            total=Count("id"), active=Count("id", filter=Q(is_active=True))
+        )
+        total_clients = client_stats["total"]
+        active_clients = client_stats["active"]
 
         clients_with_appointments = (
             ClientProfile.objects.filter(appointments__start__gte=thirty_days_ago)
@@ -1370,14 +1433,22 @@ class StatisticsView(APIView):
             .count()
         )
 
-        total_services = Service.objects.count()
-        active_services = Service.objects.filter(is_active=True).count()
+        service_stats = Service.objects.aggregate(
+            total=Count("id"), active=Count("id", filter=Q(is_active=True))
+        )
+        total_services = service_stats["total"]
+        active_services = service_stats["active"]
         popular_services = (
             Service.objects.filter(
                 appointments__start__gte=thirty_days_ago,
                 appointments__status=Appointment.Status.COMPLETED,
             )
-            .annotate(booking_count=Count("appointments"), total_revenue=Sum("price"))
+            # Leave the description TEXT column out of the grouped rows.
+            .only("id", "name", "category", "price")
+            .annotate(
+                booking_count=Count("appointments"),
+                total_revenue=Sum("appointments__service_price"),
+            )
             .order_by("-booking_count")[:10]
         )
 
@@ -1470,6 +1541,21 @@ class ReportView(APIView):
             {"error": "Nieznany typ raportu."}, status=status.HTTP_400_BAD_REQUEST
         )
 
+    @staticmethod
+    def _window(days):
+        until = timezone.now()
+        return until - timedelta(days=days), until
+
+    @staticmethod
+    def _status_counts(appointments):
+        return appointments.aggregate(
+            total=Count("id"),
+            **{
+                value: Count("id", filter=Q(status=value))
+                for value in Appointment.Status.values
+            },
+        )
+
     def _register_fonts(self):
 
         font_path = os.path.join(settings.BASE_DIR, "static", "fonts", "DejaVuSans.ttf")
@@ -1493,11 +1579,14 @@ class ReportView(APIView):
         fonts_ok = self._register_fonts()
         font_name = "DejaVuSans" if fonts_ok else "Helvetica"
 
-        buffer = io.BytesIO()
+        response = HttpResponse(content_type="application/pdf")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
         pagesize = landscape(A4) if landscape_mode else A4
 
+        # ReportLab writes the finished PDF straight into the response in one
+        # write() call; no intermediate BytesIO copy.
         doc = SimpleDocTemplate(
-            buffer,
+            response,
             pagesize=pagesize,
             rightMargin=30,
             leftMargin=30,
@@ -1544,17 +1633,35 @@ class ReportView(APIView):
         elements.append(table)
         doc.build(elements)
 
-        buffer.seek(0)
-        response = HttpResponse(buffer.getvalue(), content_type="application/pdf")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
         return response
 
     def _employee_performance_pdf(self):
 
-        since = timezone.now() - timedelta(days=30)
-        until = timezone.now()
+        since, until = self._window(days=30)
 
-        employees = EmployeeProfile.objects.filter(is_active=True)
+        in_range = Q(appointments__start__gte=since, appointments__start__lte=until)
+        completed_q = in_range & Q(appointments__status=Appointment.Status.COMPLETED)
+        employees = EmployeeProfile.objects.filter(is_active=True).annotate(
+            total=Count("appointments", filter=in_range),
+            completed_count=Count("appointments", filter=completed_q),
+            no_shows=Count(
+                "appointments",
+                filter=in_range
+                & Q(appointments__status=Appointment.Status.NO_SHOW),
+            ),
+            confirmed_total=Count(
+                "appointments",
+                filter=in_range
+                & Q(
+                    appointments__status__in=[
+                        Appointment.Status.CONFIRMED,
+                        Appointment.Status.COMPLETED,
+                        Appointment.Status.NO_SHOW,
+                    ]
+                ),
+            ),
+            revenue=Sum("appointments__service_price", filter=completed_q),
+        )
 
         data = [
             [
@@ -1570,26 +1677,11 @@ class ReportView(APIView):
         ]
 
         for emp in employees:
-            appointments = Appointment.objects.filter(
-                employee=emp, start__gte=since, start__lte=until
-            )
-
-            total = appointments.count()
-            completed = appointments.filter(status=Appointment.Status.COMPLETED)
-            completed_count = completed.count()
-            no_shows = appointments.filter(status=Appointment.Status.NO_SHOW).count()
-
-            revenue = completed.aggregate(total=Sum("service__price"))[
-                "total"
-            ] or Decimal("0")
-
-            confirmed_total = appointments.filter(
-                status__in=[
-                    Appointment.Status.CONFIRMED,
-                    Appointment.Status.COMPLETED,
-                    Appointment.Status.NO_SHOW,
-                ]
-            ).count()
+            total = emp.total
+            completed_count = emp.completed_count
+            no_shows = emp.no_shows
+            revenue = emp.revenue or Decimal("0")
+            confirmed_total = emp.confirmed_total
             no_show_rate = (
                 (no_shows / confirmed_total * 100) if confirmed_total > 0 else 0
             )
@@ -1616,10 +1708,7 @@ class ReportView(APIView):
         )
 
     def _revenue_analysis_pdf(self):
-        from datetime import timedelta
-
-        since = timezone.now() - timedelta(days=30)
-        until = timezone.now()
+        since, until = self._window(days=30)
 
         completed = Appointment.objects.filter(
             status=Appointment.Status.COMPLETED,
@@ -1629,7 +1718,7 @@ class ReportView(APIView):
 
         top_services = (
             completed.values("service__name", "service__category")
-            .annotate(revenue=Sum("service__price"), count=Count("id"))
+            .annotate(revenue=Sum("service_price"), count=Count("id"))
             .order_by("-revenue")[:10]
         )
 
@@ -1653,10 +1742,7 @@ class ReportView(APIView):
         )
 
     def _client_analytics_pdf(self):
-        from datetime import timedelta
-
-        since = timezone.now() - timedelta(days=30)
-        until = timezone.now()
+        since, until = self._window(days=30)
 
         top_clients = (
             Appointment.objects.filter(
@@ -1665,7 +1751,7 @@ class ReportView(APIView):
                 start__lte=until,
             )
             .values("client__first_name", "client__last_name", "client__client_number")
-            .annotate(revenue=Sum("service__price"), visits=Count("id"))
+            .annotate(revenue=Sum("service_price"), visits=Count("id"))
             .order_by("-revenue")[:20]
         )
 
@@ -1697,28 +1783,21 @@ class ReportView(APIView):
         )
 
     def _operations_pdf(self):
-        from datetime import timedelta
-
-        since = timezone.now() - timedelta(days=30)
-        until = timezone.now()
+        since, until = self._window(days=30)
 
         appointments = Appointment.objects.filter(start__gte=since, start__lte=until)
 
-        total = appointments.count()
-        pending = appointments.filter(status=Appointment.Status.PENDING).count()
-        confirmed = appointments.filter(status=Appointment.Status.CONFIRMED).count()
-        completed = appointments.filter(status=Appointment.Status.COMPLETED).count()
-        cancelled = appointments.filter(status=Appointment.Status.CANCELLED).count()
-        no_shows = appointments.filter(status=Appointment.Status.NO_SHOW).count()
+        counts = self._status_counts(appointments)
+        total = counts["total"]
 
         data = [["Status", "Liczba", "Procent"]]
 
         status_list = [
-            ("Oczekujące", pending),
-            ("Potwierdzone", confirmed),
-            ("Ukończone", completed),
-            ("Anulowane", cancelled),
-            ("Nieobecność", no_shows),
+            ("Oczekujące", counts[Appointment.Status.PENDING]),
+            ("Potwierdzone", counts[Appointment.Status.CONFIRMED]),
+            ("Ukończone", counts[Appointment.Status.COMPLETED]),
+            ("Anulowane", counts[Appointment.Status.CANCELLED]),
+            ("Nieobecność", counts[Appointment.Status.NO_SHOW]),
         ]
 
         for status_name, count in status_list:
@@ -1740,8 +1819,7 @@ class ReportView(APIView):
 
     def _capacity_utilization_pdf(self):
 
-        since = timezone.now() - timedelta(days=7)
-        until = timezone.now()
+        since, until = self._window(days=7)
 
         appointments = Appointment.objects.filter(
             start__gte=since,